@@ -37,8 +37,13 @@ class Variable(getMetaClassBase("Variable", require_slots=True)):
         "traces",
         "users",
         "writers",
+        "code_name",
     )
 
+    # Prefix for the C code name of the variable, used by "_getVariableCodeName"
+    # of "nuitka.code_generation.VariableCodes".
+    code_name_prefix = "var_"
+
     @counted_init
     def __init__(self, owner, variable_name):
         assert type(variable_name) is str, variable_name
@@ -57,6 +62,9 @@ class Variable(getMetaClassBase("Variable", require_slots=True)):
         self.users = None
         self.writers = None
 
+        # Computed on demand by code generation only.
+        self.code_name = None
+
     if isCountingInstances():
         __del__ = counted_del()
 
@@ -90,11 +98,14 @@ class Variable(getMetaClassBase("Variable", require_slots=True)):
         return self.owner.getEntryPoint()
 
     def getCodeName(self):
-        var_name = self.variable_name
-        var_name = var_name.replace(".", "$")
-        var_name = Utils.encodeNonAscii(var_name)
+        if self.code_name is None:
+            var_name = self.variable_name
+            var_name = var_name.replace(".", "$")
+            var_name = Utils.encodeNonAscii(var_name)
+
+            self.code_name = var_name
 
-        return var_name
+        return self.code_name
 
     def allocateTargetNumber(self):
         self.version_number += 1
@@ -316,6 +327,8 @@ class LocalVariable(Variable):
 class ParameterVariable(LocalVariable):
     __slots__ = ()
 
+    code_name_prefix = "par_"
+
     def __init__(self, owner, parameter_name):
         LocalVariable.__init__(self, owner=owner, variable_name=parameter_name)
 
@@ -384,6 +397,8 @@ class ModuleVariable(Variable):
 class TempVariable(Variable):
     __slots__ = ("variable_type",)
 
+    code_name_prefix = "tmp_"
+
     def __init__(self, owner, variable_name, variable_type):
         Variable.__init__(self, owner=owner, variable_name=variable_name)
 
@@ -251,6 +251,18 @@ NUITKA_MAY_BE_UNUSED static bool DICT_REMOVE_ITEM(PyObject *dict, PyObject *key)
     return true;
 }
 
+// Remove a dict item, clearing the error if e.g. it was not present, false=not removed
+NUITKA_MAY_BE_UNUSED static bool DICT_REMOVE_ITEM_WITHOUT_ERROR(PyThreadState *tstate, PyObject *dict, PyObject *key) {
+    int status = PyDict_DelItem(dict, key);
+
+    if (unlikely(status == -1)) {
+        CLEAR_ERROR_OCCURRED(tstate);
+        return false;
+    }
+
+    return true;
+}
+
 // Get dict lookup for a key, similar to PyDict_GetItemWithError, ref returned
 extern PyObject *DICT_GET_ITEM_WITH_ERROR(PyThreadState *tstate, PyObject *dict, PyObject *key);
 
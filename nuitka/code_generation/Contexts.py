@@ -330,7 +330,12 @@ class CodeObjectsMixin(object):
 
 
 class PythonContextBase(getMetaClassBase("Context", require_slots=True)):
-    __slots__ = ("source_ref", "current_source_ref")
+    __slots__ = (
+        "source_ref",
+        "current_source_ref",
+        "variable_owner_accesses",
+        "variable_declarations",
+    )
 
     @counted_init
     def __init__(self):
@@ -338,6 +343,11 @@ class PythonContextBase(getMetaClassBase("Context", require_slots=True)):
 
         self.current_source_ref = None
 
+        # Caches for resolving variable owners and declarations of variables
+        # in this context, these are looked up for every variable access.
+        self.variable_owner_accesses = {}
+        self.variable_declarations = {}
+
     if isCountingInstances():
         __del__ = counted_del()
 
@@ -365,6 +375,10 @@ class PythonContextBase(getMetaClassBase("Context", require_slots=True)):
     def getConstantCode(self, constant, deep_check=False):
         pass
 
+    @abstractmethod
+    def getVariableNameConstantCode(self, variable_name):
+        pass
+
     @abstractmethod
     def addModuleInitCode(self, code):
         pass
@@ -531,6 +545,9 @@ class PythonChildContextBase(PythonContextBase):
     def getConstantCode(self, constant, deep_check=False):
         return self.parent.getConstantCode(constant, deep_check=deep_check)
 
+    def getVariableNameConstantCode(self, variable_name):
+        return self.parent.getVariableNameConstantCode(variable_name)
+
     def addModuleInitCode(self, code):
         self.parent.addModuleInitCode(code)
 
@@ -646,6 +663,17 @@ class FrameDeclarationsMixin(object):
     def setVariableType(self, variable, variable_declaration):
         assert variable.isLocalVariable(), variable
 
+        # This is done for every write of the variable, but the declaration
+        # of a variable doesn't change, so only the first time counts.
+        if variable in self.frame_variable_types:
+            if Options.is_debug:
+                assert self.frame_variable_types[variable] == (
+                    str(variable_declaration),
+                    variable_declaration.getCType().getTypeIndicator(),
+                ), variable
+
+            return
+
         # TODO: Change value of that dict to take advantage of declaration.
         self.frame_variable_types[variable] = (
             str(variable_declaration),
@@ -771,6 +799,7 @@ class PythonModuleContext(
         "variable_storage",
         "function_table_entries",
         "constant_accessor",
+        "variable_name_constant_codes",
         "module_init_codes",
         # FrameDeclarationsMixin
         "frame_variables_stack",
@@ -828,6 +857,8 @@ class PythonModuleContext(
             top_level_name="mod_consts", data_filename=data_filename
         )
 
+        self.variable_name_constant_codes = {}
+
         self.module_init_codes = []
 
     def __repr__(self):
@@ -886,6 +917,20 @@ class PythonModuleContext(
 
         return self.constant_accessor.getConstantCode(constant)
 
+    def getVariableNameConstantCode(self, variable_name):
+        """Constant code for a variable name, e.g. for module variable access.
+
+        These are used very often for the same names, so we cache them rather
+        than going through the constant accessor each time.
+        """
+        result = self.variable_name_constant_codes.get(variable_name)
+
+        if result is None:
+            result = self.getConstantCode(constant=variable_name)
+            self.variable_name_constant_codes[variable_name] = result
+
+        return result
+
     def getConstantsCount(self):
         return self.constant_accessor.getConstantsCount()
 
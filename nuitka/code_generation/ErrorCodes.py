@@ -221,7 +221,7 @@ def getLocalVariableReferenceErrorCode(variable, condition, emit, context):
             helper_code,
             exception_type,
             exception_value,
-            context.getConstantCode(variable_name),
+            context.getVariableNameConstantCode(variable_name),
         ),
         "%s = NULL;" % exception_tb,
     ]
@@ -268,7 +268,7 @@ def getNameReferenceErrorCode(variable_name, condition, emit, context):
             "condition": condition,
             "exception_exit": context.getExceptionEscape(),
             "raise_name_error_helper": helper_code,
-            "variable_name": context.getConstantCode(variable_name),
+            "variable_name": context.getVariableNameConstantCode(variable_name),
             "release_temps": indented(getErrorExitReleaseCode(context)),
             "var_description_code": indented(
                 getFrameVariableTypeDescriptionCode(context)
@@ -5,11 +5,18 @@
 
 """
 
+from nuitka.__past__ import intern
 from nuitka.nodes.shapes.BuiltinTypeShapes import (
     tshape_bool,
     tshape_int_or_long,
 )
 from nuitka.PythonVersions import python_version
+from nuitka.Variables import (
+    LocalVariable,
+    ModuleVariable,
+    ParameterVariable,
+    TempVariable,
+)
 
 from .c_types.CTypeNuitkaBooleans import CTypeNuitkaBoolEnum
 from .c_types.CTypePyObjectPointers import (
@@ -28,6 +35,7 @@ from .ErrorCodes import (
     getLocalVariableReferenceErrorCode,
     getNameReferenceErrorCode,
 )
+from .templates.CodeTemplatesVariables import emit_read_mvar_with_fallback
 from .VariableDeclarations import VariableDeclaration
 
 
@@ -80,7 +88,6 @@ def generateDelVariableCode(statement, emit, context):
         _getVariableDelCode(
             variable=statement.getVariable(),
             variable_trace=statement.variable_trace,
-            previous_trace=statement.previous_trace,
             tolerant=statement.is_tolerant,
             needs_check=statement.is_tolerant
             or statement.mayRaiseException(BaseException),
@@ -89,76 +96,135 @@ def generateDelVariableCode(statement, emit, context):
         )
 
 
-def getVariableReferenceCode(
+# The reference and del code collects its code pieces and emits them joined,
+# so the "emit" given, which splits what it gets into lines, is called only
+# once for each variable access.
+
+
+def _getModuleVariableReferenceCode(
     to_name, variable, variable_trace, needs_check, conversion_check, emit, context
 ):
-    if variable.isModuleVariable():
-        owner = context.getOwner()
+    # Traces are not used for module variables, pylint: disable=unused-argument
+    owner = context.getOwner()
+
+    with withObjectCodeTemporaryAssignment2(
+        to_name, "mvar_value", conversion_check, emit, context
+    ) as value_name:
+        # TODO: Rather have this passed from a distinct node type, so inlining
+        # doesn't change things.
+
+        codes = []
+
+        emit_read_mvar_with_fallback(
+            emit=codes.append,
+            helper_code=(
+                "GET_MODULE_VARIABLE_VALUE_FALLBACK_IN_FUNCTION"
+                if python_version < 0x340
+                and not owner.isCompiledPythonModule()
+                and not owner.isExpressionClassBodyBase()
+                else "GET_MODULE_VARIABLE_VALUE_FALLBACK"
+            ),
+            module_identifier=context.getModuleCodeName(),
+            value_name=value_name,
+            var_name=context.getVariableNameConstantCode(variable.getName()),
+        )
 
-        with withObjectCodeTemporaryAssignment2(
-            to_name, "mvar_value", conversion_check, emit, context
-        ) as value_name:
-            # TODO: Rather have this passed from a distinct node type, so inlining
-            # doesn't change things.
+        getErrorExitCode(
+            check_name=value_name,
+            emit=codes.append,
+            context=context,
+            needs_check=needs_check,
+        )
 
-            emit(
-                """\
-%(value_name)s = GET_STRING_DICT_VALUE(moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s);
+        emit("\n".join(codes))
 
-if (unlikely(%(value_name)s == NULL)) {
-    %(value_name)s = %(helper_code)s(tstate, %(var_name)s);
-}
-"""
-                % {
-                    "helper_code": (
-                        "GET_MODULE_VARIABLE_VALUE_FALLBACK_IN_FUNCTION"
-                        if python_version < 0x340
-                        and not owner.isCompiledPythonModule()
-                        and not owner.isExpressionClassBodyBase()
-                        else "GET_MODULE_VARIABLE_VALUE_FALLBACK"
-                    ),
-                    "module_identifier": context.getModuleCodeName(),
-                    "value_name": value_name,
-                    "var_name": context.getConstantCode(constant=variable.getName()),
-                }
-            )
 
-            getErrorExitCode(
-                check_name=value_name,
-                emit=emit,
-                context=context,
-                needs_check=needs_check,
-            )
-    else:
-        variable_declaration = getLocalVariableDeclaration(
-            context, variable, variable_trace
-        )
+def _getLocalVariableReferenceCode(
+    to_name, variable, variable_trace, needs_check, conversion_check, emit, context
+):
+    variable_declaration = getLocalVariableDeclaration(
+        context, variable, variable_trace
+    )
 
-        value_name = variable_declaration.getCType().emitValueAccessCode(
-            value_name=variable_declaration, emit=emit, context=context
+    # Fast path for the most common case of reading a plain object variable
+    # into an object target without a check. The C type is known then, and
+    # its value access gives the declaration itself, so the dispatch and the
+    # collection of code pieces can be avoided.
+    if (
+        not needs_check
+        and variable_declaration.c_type == "PyObject *"
+        and to_name.c_type == "PyObject *"
+    ):
+        CTypePyObjectPtr.emitValueAssertionCode(
+            value_name=variable_declaration, emit=emit
         )
 
-        if needs_check:
-            condition = value_name.getCType().getInitTestConditionCode(
-                value_name, inverted=True
-            )
-
-            getLocalVariableReferenceErrorCode(
-                variable=variable, condition=condition, emit=emit, context=context
-            )
-        else:
-            value_name.getCType().emitValueAssertionCode(
-                value_name=value_name, emit=emit
-            )
-
-        to_name.getCType().emitAssignConversionCode(
+        CTypePyObjectPtr.emitAssignConversionCode(
             to_name=to_name,
-            value_name=value_name,
+            value_name=variable_declaration,
             needs_check=conversion_check,
             emit=emit,
             context=context,
         )
 
+        return
+
+    codes = []
+
+    value_name = variable_declaration.getCType().emitValueAccessCode(
+        value_name=variable_declaration, emit=codes.append, context=context
+    )
+
+    if needs_check:
+        condition = value_name.getCType().getInitTestConditionCode(
+            value_name, inverted=True
+        )
+
+        getLocalVariableReferenceErrorCode(
+            variable=variable,
+            condition=condition,
+            emit=codes.append,
+            context=context,
+        )
+    else:
+        value_name.getCType().emitValueAssertionCode(
+            value_name=value_name, emit=codes.append
+        )
+
+    to_name.getCType().emitAssignConversionCode(
+        to_name=to_name,
+        value_name=value_name,
+        needs_check=conversion_check,
+        emit=codes.append,
+        context=context,
+    )
+
+    if codes:
+        emit("\n".join(codes))
+
+
+# Reference code per variable class.
+_variable_reference_code_getters = {
+    ModuleVariable: _getModuleVariableReferenceCode,
+    LocalVariable: _getLocalVariableReferenceCode,
+    ParameterVariable: _getLocalVariableReferenceCode,
+    TempVariable: _getLocalVariableReferenceCode,
+}
+
+
+def getVariableReferenceCode(
+    to_name, variable, variable_trace, needs_check, conversion_check, emit, context
+):
+    _variable_reference_code_getters[type(variable)](
+        to_name=to_name,
+        variable=variable,
+        variable_trace=variable_trace,
+        needs_check=needs_check,
+        conversion_check=conversion_check,
+        emit=emit,
+        context=context,
+    )
+
 
 def generateVariableReferenceCode(to_name, expression, emit, context):
     variable = expression.getVariable()
@@ -177,25 +243,26 @@ def generateVariableReferenceCode(to_name, expression, emit, context):
     )
 
 
-def _getVariableCodeName(in_context, variable):
+def _getVariableCodeName(in_context, variable, prefix):
     if in_context:
         # Closure case:
-        return "closure_" + variable.getCodeName()
-    elif variable.isParameterVariable():
-        return "par_" + variable.getCodeName()
-    elif variable.isTempVariable():
-        return "tmp_" + variable.getCodeName()
+        result = prefix + "closure_" + variable.getCodeName()
     else:
-        return "var_" + variable.getCodeName()
+        result = prefix + variable.code_name_prefix + variable.getCodeName()
 
+    # These names are used as keys of the variable declarations and will be
+    # repeated a lot in the generated code, so have them only once.
+    return intern(result)
 
-def getPickedCType(variable, context):
-    """Return type to use for specific context."""
 
-    user = context.getEntryPoint()
-    owner = variable.getEntryPoint()
+def getPickedCType(variable, in_context, context):
+    """Return type to use for specific context.
 
-    if owner is user:
+    The "in_context" indicates if the variable is owned by the context, rather
+    than being in its closure, see "_getVariableOwnerAccess".
+    """
+
+    if in_context:
         if variable.isSharedTechnically():
             # TODO: That need not really be an impedient, we could share pointers to
             # everything.
@@ -223,36 +290,57 @@ def getPickedCType(variable, context):
     return result
 
 
-def decideLocalVariableCodeType(context, variable):
-    # Now must be local or temporary variable.
+def _getVariableOwnerAccess(context, owner):
+    """Resolve a variable owner for access from a context.
 
-    # Complexity should be moved out of here, pylint: disable=too-many-branches
+    Returns the entry point of the context, if the owner with outlines
+    resolved to their entry point is that same entry point, i.e. if the
+    variable is in the context rather than its closure, and the prefix to
+    use for outline variables. These do not change during code generation
+    of a context, so they are cached.
+    """
+    result = context.variable_owner_accesses.get(owner)
 
-    user = context.getOwner()
-    owner = variable.getOwner()
+    if result is None:
+        user = context.getOwner().getEntryPoint()
 
-    user = user.getEntryPoint()
+        prefix = ""
 
-    prefix = ""
+        if owner.isExpressionOutlineFunctionBase():
+            entry_point = owner.getEntryPoint()
 
-    if owner.isExpressionOutlineFunctionBase():
-        entry_point = owner.getEntryPoint()
+            prefix = (
+                "outline_%d_"
+                % entry_point.getTraceCollection().getOutlineFunctions().index(owner)
+            )
+        else:
+            entry_point = owner
 
-        prefix = (
-            "outline_%d_"
-            % entry_point.getTraceCollection().getOutlineFunctions().index(owner)
+        result = context.variable_owner_accesses[owner] = (
+            user,
+            entry_point is user,
+            prefix,
         )
-        owner = entry_point
+
+    return result
+
+
+def decideLocalVariableCodeType(context, variable):
+    # Now must be local or temporary variable.
+
+    # Complexity should be moved out of here, pylint: disable=too-many-branches
+
+    user, in_context, prefix = _getVariableOwnerAccess(context, variable.getOwner())
 
     if variable.isTempVariableBool():
         c_type = CTypeNuitkaBoolEnum
     else:
-        c_type = getPickedCType(variable, context)
-
-    if owner is user:
-        result = _getVariableCodeName(in_context=False, variable=variable)
+        c_type = getPickedCType(variable, in_context, context)
 
-        result = prefix + result
+    if in_context:
+        result = _getVariableCodeName(
+            in_context=False, variable=variable, prefix=prefix
+        )
     elif context.isForDirectCall():
         if user.isExpressionGeneratorObjectBody():
             closure_index = user.getClosureVariableIndex(variable)
@@ -267,9 +355,9 @@ def decideLocalVariableCodeType(context, variable):
 
             result = "asyncgen->m_closure[%d]" % closure_index
         else:
-            result = _getVariableCodeName(in_context=True, variable=variable)
-
-            result = prefix + result
+            result = _getVariableCodeName(
+                in_context=True, variable=variable, prefix=prefix
+            )
     else:
         closure_index = user.getClosureVariableIndex(variable)
 
@@ -293,36 +381,63 @@ def getLocalVariableDeclaration(context, variable, variable_trace):
 
     # Now must be local or temporary variable.
 
-    user = context.getOwner()
-    owner = variable.getOwner()
+    # The decision if the variable is in the context or in its closure, and
+    # with it the declaration, doesn't change during code generation of the
+    # context, so it's only done once per variable.
+    result = context.variable_declarations.get(variable)
 
-    user = user.getEntryPoint()
+    if result is None:
+        user, in_context, prefix = _getVariableOwnerAccess(context, variable.getOwner())
 
-    prefix = ""
+        if in_context:
+            result = _getVariableCodeName(
+                in_context=False, variable=variable, prefix=prefix
+            )
 
-    if owner.isExpressionOutlineFunctionBase():
-        entry_point = owner.getEntryPoint()
+            result = context.variable_storage.getVariableDeclarationTop(result)
 
-        prefix = (
-            "outline_%d_"
-            % entry_point.getTraceCollection().getOutlineFunctions().index(owner)
-        )
-        owner = entry_point
+            assert result is not None, variable
+        else:
+            closure_index = user.getClosureVariableIndex(variable)
 
-    if owner is user:
-        result = _getVariableCodeName(in_context=False, variable=variable)
+            result = context.variable_storage.getVariableDeclarationClosure(
+                closure_index
+            )
 
-        result = prefix + result
+        context.variable_declarations[variable] = result
 
-        result = context.variable_storage.getVariableDeclarationTop(result)
+    return result
 
-        assert result is not None, variable
 
-        return result
-    else:
-        closure_index = user.getClosureVariableIndex(variable)
+def _getModuleVariableDeclaration(context, variable, variable_trace):
+    # Traces are not used for module variables, pylint: disable=unused-argument
+
+    result = context.variable_declarations.get(variable)
 
-        return context.variable_storage.getVariableDeclarationClosure(closure_index)
+    if result is None:
+        result = VariableDeclaration("module_var", variable.getName(), None, None)
+
+        context.variable_declarations[variable] = result
+
+    return result
+
+
+def _getFrameVariableDeclaration(context, variable, variable_trace):
+    result = getLocalVariableDeclaration(context, variable, variable_trace)
+
+    # Written local variables have their type described for the frame.
+    context.setVariableType(variable, result)
+
+    return result
+
+
+# Declaration to use for writing to a variable per variable class.
+_variable_write_declaration_getters = {
+    ModuleVariable: _getModuleVariableDeclaration,
+    LocalVariable: _getFrameVariableDeclaration,
+    ParameterVariable: _getFrameVariableDeclaration,
+    TempVariable: getLocalVariableDeclaration,
+}
 
 
 def getVariableAssignmentCode(
@@ -334,19 +449,11 @@ def getVariableAssignmentCode(
     else:
         ref_count = 0
 
-    if variable.isModuleVariable():
-        variable_declaration = VariableDeclaration(
-            "module_var", variable.getName(), None, None
-        )
-    else:
-        variable_declaration = getLocalVariableDeclaration(
-            context, variable, variable_trace
-        )
-
-        assert variable_declaration, (variable, context)
+    variable_declaration = _variable_write_declaration_getters[type(variable)](
+        context, variable, variable_trace
+    )
 
-        if variable.isLocalVariable():
-            context.setVariableType(variable, variable_declaration)
+    assert variable_declaration, (variable, context)
 
     variable_declaration.getCType().emitVariableAssignCode(
         value_name=variable_declaration,
@@ -362,60 +469,72 @@ def getVariableAssignmentCode(
         context.removeCleanupTempName(tmp_name)
 
 
-def _getVariableDelCode(
-    variable, variable_trace, previous_trace, tolerant, needs_check, emit, context
-):
-    if variable.isModuleVariable():
-        variable_declaration_old = VariableDeclaration(
-            "module_var", variable.getName(), None, None
-        )
-        variable_declaration_new = variable_declaration_old
-    else:
-        variable_declaration_old = getLocalVariableDeclaration(
-            context, variable, previous_trace
-        )
-        variable_declaration_new = getLocalVariableDeclaration(
-            context, variable, variable_trace
-        )
+def _getModuleVariableDelErrorCode(variable, to_name, emit, context):
+    getNameReferenceErrorCode(
+        variable_name=variable.getName(),
+        condition="%s == false" % to_name,
+        emit=emit,
+        context=context,
+    )
+
+
+def _getLocalVariableDelErrorCode(variable, to_name, emit, context):
+    getLocalVariableReferenceErrorCode(
+        variable=variable,
+        condition="%s == false" % to_name,
+        emit=emit,
+        context=context,
+    )
+
+
+def _getTempVariableDelErrorCode(variable, to_name, emit, context):
+    # Not needed for assertion, pylint: disable=unused-argument
+    getAssertionCode(check="%s != false" % to_name, emit=emit)
+
+
+# Error code for a del of an unassigned variable per variable class.
+_variable_del_error_code_getters = {
+    ModuleVariable: _getModuleVariableDelErrorCode,
+    LocalVariable: _getLocalVariableDelErrorCode,
+    ParameterVariable: _getLocalVariableDelErrorCode,
+    TempVariable: _getTempVariableDelErrorCode,
+}
+
+
+def _getVariableDelCode(variable, variable_trace, tolerant, needs_check, emit, context):
+    variable_class = type(variable)
+
+    declaration_getter = _variable_write_declaration_getters[variable_class]
 
-        # TODO: We need to split this operation in two parts. Release and init
-        # are not one thing, until then require this.
-        assert variable_declaration_old == variable_declaration_new
+    variable_declaration = declaration_getter(context, variable, variable_trace)
 
-        if variable.isLocalVariable():
-            context.setVariableType(variable, variable_declaration_new)
+    # TODO: We need to split this operation in two parts. Release and init
+    # are not one thing, but declarations are per variable, not per trace, so
+    # the one of the previous trace is necessarily the same currently.
 
     if needs_check and not tolerant:
         to_name = context.getBoolResName()
     else:
         to_name = None
 
-    variable_declaration_old.getCType().getDeleteObjectCode(
+    codes = []
+
+    variable_declaration.getCType().getDeleteObjectCode(
         to_name=to_name,
-        value_name=variable_declaration_old,
+        value_name=variable_declaration,
         tolerant=tolerant,
         needs_check=needs_check,
-        emit=emit,
+        emit=codes.append,
         context=context,
     )
 
     if to_name is not None:
-        if variable.isModuleVariable():
-            getNameReferenceErrorCode(
-                variable_name=variable.getName(),
-                condition="%s == false" % to_name,
-                emit=emit,
-                context=context,
-            )
-        elif variable.isLocalVariable():
-            getLocalVariableReferenceErrorCode(
-                variable=variable,
-                condition="%s == false" % to_name,
-                emit=emit,
-                context=context,
-            )
-        else:
-            getAssertionCode(check="%s != false" % to_name, emit=emit)
+        _variable_del_error_code_getters[variable_class](
+            variable=variable, to_name=to_name, emit=codes.append, context=context
+        )
+
+    if codes:
+        emit("\n".join(codes))
 
 
 def generateVariableReleaseCode(statement, emit, context):
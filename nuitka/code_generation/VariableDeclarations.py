@@ -21,6 +21,22 @@ from .c_types.CTypePyObjectPointers import (
     CTypePyObjectPtrPtr,
 )
 
+# C types by the name used in declarations, for "VariableDeclaration.getCType"
+# which is used for nearly every code generation involving variables.
+_c_types_by_name = {
+    "PyObject *": CTypePyObjectPtr,
+    "struct Nuitka_CellObject *": CTypeCellObject,
+    "PyObject **": CTypePyObjectPtrPtr,
+    "nuitka_bool": CTypeNuitkaBoolEnum,
+    "bool": CTypeBool,
+    "nuitka_ilong": CTypeNuitkaIntOrLongStruct,
+    "module_var": CTypeModuleDictVariable,
+    "nuitka_void": CTypeNuitkaVoidEnum,
+    "long": CTypeCLong,
+    "nuitka_digit": CTypeCLongDigit,
+    "double": CTypeCFloat,
+}
+
 
 class VariableDeclaration(object):
     __slots__ = ("c_type", "code_name", "init_value", "heap_name", "maybe_unused")
@@ -85,34 +101,11 @@ class VariableDeclaration(object):
 
     def getCType(self):
         # TODO: This ought to become unnecessary function
-        # In the mean time, many cases: pylint: disable=too-many-return-statements
+        result = _c_types_by_name.get(self.c_type)
 
-        c_type = self.c_type
+        assert result is not None, self.c_type
 
-        if c_type == "PyObject *":
-            return CTypePyObjectPtr
-        elif c_type == "struct Nuitka_CellObject *":
-            return CTypeCellObject
-        elif c_type == "PyObject **":
-            return CTypePyObjectPtrPtr
-        elif c_type == "nuitka_bool":
-            return CTypeNuitkaBoolEnum
-        elif c_type == "bool":
-            return CTypeBool
-        elif c_type == "nuitka_ilong":
-            return CTypeNuitkaIntOrLongStruct
-        elif c_type == "module_var":
-            return CTypeModuleDictVariable
-        elif c_type == "nuitka_void":
-            return CTypeNuitkaVoidEnum
-        elif c_type == "long":
-            return CTypeCLong
-        elif c_type == "nuitka_digit":
-            return CTypeCLongDigit
-        elif c_type == "double":
-            return CTypeCFloat
-
-        assert False, c_type
+        return result
 
     def __str__(self):
         if self.heap_name:
@@ -133,6 +126,8 @@ class VariableStorage(object):
         "heap_name",
         "variable_declarations_heap",
         "variable_declarations_main",
+        "variable_declarations_heap_names",
+        "variable_declarations_main_names",
         "variable_declarations_closure",
         "variable_declarations_locals",
         "exception_variable_declarations",
@@ -145,6 +140,11 @@ class VariableStorage(object):
         self.variable_declarations_main = []
         self.variable_declarations_closure = []
 
+        # Lookup of top level declarations by code name, these are searched
+        # for every variable access and temporary variable allocation.
+        self.variable_declarations_heap_names = {}
+        self.variable_declarations_main_names = {}
+
         self.variable_declarations_locals = []
 
         self.exception_variable_declarations = None
@@ -165,15 +165,12 @@ class VariableStorage(object):
         self.variable_declarations_locals.pop()
 
     def getVariableDeclarationTop(self, code_name):
-        for variable_declaration in self.variable_declarations_main:
-            if variable_declaration.code_name == code_name:
-                return variable_declaration
+        result = self.variable_declarations_main_names.get(code_name)
 
-        for variable_declaration in self.variable_declarations_heap:
-            if variable_declaration.code_name == code_name:
-                return variable_declaration
+        if result is None:
+            result = self.variable_declarations_heap_names.get(code_name)
 
-        return None
+        return result
 
     def getVariableDeclarationClosure(self, closure_index):
         return self.variable_declarations_closure[closure_index]
@@ -229,6 +226,7 @@ class VariableStorage(object):
         result = VariableDeclaration(c_type, code_name, init_value, None)
 
         self.variable_declarations_main.append(result)
+        self.variable_declarations_main_names.setdefault(code_name, result)
 
         return result
 
@@ -237,8 +235,10 @@ class VariableStorage(object):
 
         if self.heap_name is not None:
             self.variable_declarations_heap.append(result)
+            self.variable_declarations_heap_names.setdefault(code_name, result)
         else:
             self.variable_declarations_main.append(result)
+            self.variable_declarations_main_names.setdefault(code_name, result)
 
         return result
 
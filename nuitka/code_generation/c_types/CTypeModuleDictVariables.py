@@ -10,9 +10,11 @@
 """
 
 from nuitka.code_generation.templates.CodeTemplatesVariables import (
-    template_del_global_known,
-    template_del_global_unclear,
-    template_read_mvar_unclear,
+    emit_del_global_known,
+    emit_del_global_unclear,
+    emit_read_mvar_unclear,
+    emit_write_mvar,
+    emit_write_mvar_inplace,
 )
 
 from .CTypeBases import CTypeBase
@@ -24,45 +26,31 @@ class CTypeModuleDictVariable(CTypeBase):
         cls, value_name, needs_release, tmp_name, ref_count, inplace, emit, context
     ):
         if inplace:
-            orig_name = context.getInplaceLeftName()
-
-            emit(
-                """\
-if (%(orig_name)s != %(tmp_name)s) {
-    UPDATE_STRING_DICT_INPLACE(moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(variable_name_str)s, %(tmp_name)s);
-}"""
-                % {
-                    "orig_name": orig_name,
-                    "tmp_name": tmp_name,
-                    "module_identifier": context.getModuleCodeName(),
-                    "variable_name_str": context.getConstantCode(
-                        constant=value_name.code_name
-                    ),
-                }
+            emit_write_mvar_inplace(
+                emit=emit,
+                orig_name=context.getInplaceLeftName(),
+                tmp_name=tmp_name,
+                module_identifier=context.getModuleCodeName(),
+                var_name=context.getVariableNameConstantCode(value_name.code_name),
             )
-
         else:
-            emit(
-                "UPDATE_STRING_DICT%s(moduledict_%s, (Nuitka_StringObject *)%s, %s);"
-                % (
-                    ref_count,
-                    context.getModuleCodeName(),
-                    context.getConstantCode(constant=value_name.code_name),
-                    tmp_name,
-                )
+            emit_write_mvar(
+                emit=emit,
+                ref_count=ref_count,
+                module_identifier=context.getModuleCodeName(),
+                var_name=context.getVariableNameConstantCode(value_name.code_name),
+                tmp_name=tmp_name,
             )
 
     @classmethod
     def emitValueAccessCode(cls, value_name, emit, context):
         tmp_name = context.allocateTempName("mvar_value")
 
-        emit(
-            template_read_mvar_unclear
-            % {
-                "module_identifier": context.getModuleCodeName(),
-                "tmp_name": tmp_name,
-                "var_name": context.getConstantCode(constant=value_name.code_name),
-            }
+        emit_read_mvar_unclear(
+            emit=emit,
+            module_identifier=context.getModuleCodeName(),
+            tmp_name=tmp_name,
+            var_name=context.getVariableNameConstantCode(value_name.code_name),
         )
 
         return tmp_name
@@ -72,21 +60,17 @@ if (%(orig_name)s != %(tmp_name)s) {
         cls, to_name, value_name, needs_check, tolerant, emit, context
     ):
         if not needs_check or tolerant:
-            emit(
-                template_del_global_known
-                % {
-                    "module_identifier": context.getModuleCodeName(),
-                    "var_name": context.getConstantCode(constant=value_name.code_name),
-                }
+            emit_del_global_known(
+                emit=emit,
+                module_identifier=context.getModuleCodeName(),
+                var_name=context.getVariableNameConstantCode(value_name.code_name),
             )
         else:
-            emit(
-                template_del_global_unclear
-                % {
-                    "module_identifier": context.getModuleCodeName(),
-                    "result": to_name,
-                    "var_name": context.getConstantCode(constant=value_name.code_name),
-                }
+            emit_del_global_unclear(
+                emit=emit,
+                module_identifier=context.getModuleCodeName(),
+                result=to_name,
+                var_name=context.getVariableNameConstantCode(value_name.code_name),
             )
 
 
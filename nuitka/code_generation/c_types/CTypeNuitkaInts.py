@@ -6,8 +6,8 @@
 """
 
 from nuitka.code_generation.templates.CodeTemplatesVariables import (
-    template_release_object_clear,
-    template_release_object_unclear,
+    emit_release_object_clear,
+    emit_release_object_unclear,
 )
 
 from .CTypeBases import CTypeBase
@@ -107,11 +107,11 @@ class CTypeNuitkaIntOrLongStruct(CTypeBase):
         # TODO: Have a derived C type that does it.
 
         if needs_check:
-            template = template_release_object_unclear
+            emitter = emit_release_object_unclear
         else:
-            template = template_release_object_clear
+            emitter = emit_release_object_clear
 
-        emit(template % {"identifier": "%s.ilong_object" % value_name})
+        emitter(emit, identifier="%s.ilong_object" % value_name)
 
         emit("}")
 
@@ -11,31 +11,52 @@ from nuitka.code_generation.ErrorCodes import (
     getReleaseCode,
 )
 from nuitka.code_generation.templates.CodeTemplatesVariables import (
-    template_del_local_intolerant,
-    template_del_local_known,
-    template_del_local_tolerant,
-    template_del_shared_intolerant,
-    template_del_shared_known,
-    template_del_shared_tolerant,
-    template_release_object_clear,
-    template_release_object_unclear,
-    template_write_local_clear_ref0,
-    template_write_local_clear_ref1,
-    template_write_local_empty_ref0,
-    template_write_local_empty_ref1,
-    template_write_local_inplace,
-    template_write_local_unclear_ref0,
-    template_write_local_unclear_ref1,
-    template_write_shared_clear_ref0,
-    template_write_shared_clear_ref1,
-    template_write_shared_inplace,
-    template_write_shared_unclear_ref0,
-    template_write_shared_unclear_ref1,
+    emit_del_local_intolerant,
+    emit_del_local_known,
+    emit_del_local_tolerant,
+    emit_del_shared_intolerant,
+    emit_del_shared_known,
+    emit_del_shared_tolerant,
+    emit_release_object_clear,
+    emit_release_object_unclear,
+    emit_write_local_clear_ref0,
+    emit_write_local_clear_ref1,
+    emit_write_local_empty_ref0,
+    emit_write_local_empty_ref1,
+    emit_write_local_inplace,
+    emit_write_local_unclear_ref0,
+    emit_write_local_unclear_ref1,
+    emit_write_shared_clear_ref0,
+    emit_write_shared_clear_ref1,
+    emit_write_shared_inplace,
+    emit_write_shared_unclear_ref0,
+    emit_write_shared_unclear_ref1,
 )
 from nuitka.Constants import getConstantValueGuide, isMutable
 
 from .CTypeBases import CTypeBase
 
+# Assignment code to use by reference count to transfer, and release need of
+# the previous value, which can be unknown with "None" value.
+_write_local_emitters = {
+    (1, False): emit_write_local_empty_ref0,
+    (1, True): emit_write_local_clear_ref0,
+    (1, None): emit_write_local_unclear_ref0,
+    (0, False): emit_write_local_empty_ref1,
+    (0, True): emit_write_local_clear_ref1,
+    (0, None): emit_write_local_unclear_ref1,
+}
+
+# For cells, there is no difference between known and unknown previous value.
+_write_shared_emitters = {
+    (1, False): emit_write_shared_clear_ref0,
+    (1, True): emit_write_shared_unclear_ref0,
+    (1, None): emit_write_shared_unclear_ref0,
+    (0, False): emit_write_shared_clear_ref1,
+    (0, True): emit_write_shared_unclear_ref1,
+    (0, None): emit_write_shared_unclear_ref1,
+}
+
 # Need to run "bin/generate-specialized-c-code" when changing these values.
 make_list_constant_direct_threshold = 4
 make_list_constant_hinted_threshold = 13
@@ -50,24 +71,11 @@ class CPythonPyObjectPtrBase(CTypeBase):
             # Releasing is not an issue here, local variable reference never
             # gave a reference, and the in-place code deals with possible
             # replacement/release.
-            template = template_write_local_inplace
+            emitter = emit_write_local_inplace
         else:
-            if ref_count:
-                if needs_release is False:
-                    template = template_write_local_empty_ref0
-                elif needs_release is True:
-                    template = template_write_local_clear_ref0
-                else:
-                    template = template_write_local_unclear_ref0
-            else:
-                if needs_release is False:
-                    template = template_write_local_empty_ref1
-                elif needs_release is True:
-                    template = template_write_local_clear_ref1
-                else:
-                    template = template_write_local_unclear_ref1
+            emitter = _write_local_emitters[ref_count, needs_release]
 
-        emit(template % {"identifier": value_name, "tmp_name": tmp_name})
+        emitter(emit, identifier=value_name, tmp_name=tmp_name)
 
     @classmethod
     def emitAssignmentCodeToNuitkaIntOrLong(
@@ -96,11 +104,11 @@ class CPythonPyObjectPtrBase(CTypeBase):
     @classmethod
     def getReleaseCode(cls, value_name, needs_check, emit):
         if needs_check:
-            template = template_release_object_unclear
+            emitter = emit_release_object_unclear
         else:
-            template = template_release_object_clear
+            emitter = emit_release_object_clear
 
-        emit(template % {"identifier": value_name})
+        emitter(emit, identifier=value_name)
 
     @classmethod
     def emitAssignInplaceNegatedValueCode(cls, to_name, needs_check, emit, context):
@@ -338,14 +346,11 @@ class CTypePyObjectPtr(CPythonPyObjectPtrBase):
         cls, to_name, value_name, needs_check, tolerant, emit, context
     ):
         if not needs_check:
-            emit(template_del_local_known % {"identifier": value_name})
+            emit_del_local_known(emit, identifier=value_name)
         elif tolerant:
-            emit(template_del_local_tolerant % {"identifier": value_name})
+            emit_del_local_tolerant(emit, identifier=value_name)
         else:
-            emit(
-                template_del_local_intolerant
-                % {"identifier": value_name, "result": to_name}
-            )
+            emit_del_local_intolerant(emit, identifier=value_name, result=to_name)
 
     @classmethod
     def emitAssignmentCodeFromBoolCondition(cls, to_name, condition, emit):
@@ -395,11 +400,11 @@ class CTypePyObjectPtr(CPythonPyObjectPtrBase):
     @classmethod
     def getReleaseCode(cls, value_name, needs_check, emit):
         if needs_check:
-            template = template_release_object_unclear
+            emitter = emit_release_object_unclear
         else:
-            template = template_release_object_clear
+            emitter = emit_release_object_clear
 
-        emit(template % {"identifier": value_name})
+        emitter(emit, identifier=value_name)
 
     @classmethod
     def getTakeReferenceCode(cls, value_name, emit):
@@ -469,21 +474,11 @@ class CTypeCellObject(CTypeBase):
             # Releasing is not an issue here, local variable reference never
             # gave a reference, and the in-place code deals with possible
             # replacement/release.
-            template = template_write_shared_inplace
-
+            emitter = emit_write_shared_inplace
         else:
-            if ref_count:
-                if needs_release is False:
-                    template = template_write_shared_clear_ref0
-                else:
-                    template = template_write_shared_unclear_ref0
-            else:
-                if needs_release is False:
-                    template = template_write_shared_clear_ref1
-                else:
-                    template = template_write_shared_unclear_ref1
+            emitter = _write_shared_emitters[ref_count, needs_release]
 
-        emit(template % {"identifier": value_name, "tmp_name": tmp_name})
+        emitter(emit, identifier=value_name, tmp_name=tmp_name)
 
     @classmethod
     def emitValueAccessCode(cls, value_name, emit, context):
@@ -515,23 +510,20 @@ class CTypeCellObject(CTypeBase):
         cls, to_name, value_name, needs_check, tolerant, emit, context
     ):
         if not needs_check:
-            emit(template_del_shared_known % {"identifier": value_name})
+            emit_del_shared_known(emit, identifier=value_name)
         elif tolerant:
-            emit(template_del_shared_tolerant % {"identifier": value_name})
+            emit_del_shared_tolerant(emit, identifier=value_name)
         else:
-            emit(
-                template_del_shared_intolerant
-                % {"identifier": value_name, "result": to_name}
-            )
+            emit_del_shared_intolerant(emit, identifier=value_name, result=to_name)
 
     @classmethod
     def getReleaseCode(cls, value_name, needs_check, emit):
         if needs_check:
-            template = template_release_object_unclear
+            emitter = emit_release_object_unclear
         else:
-            template = template_release_object_clear
+            emitter = emit_release_object_clear
 
-        emit(template % {"identifier": value_name})
+        emitter(emit, identifier=value_name)
 
     @classmethod
     def emitReinitCode(cls, value_name, emit):
@@ -146,6 +146,16 @@ template_read_shared_known = """\
 %(tmp_name)s = Nuitka_Cell_GET(%(identifier)s);
 """
 
+# For module variable writes, the dictionary value is updated, giving the
+# reference count to transfer.
+template_write_mvar = """\
+UPDATE_STRING_DICT%(ref_count)s(moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s, %(tmp_name)s);"""
+
+template_write_mvar_inplace = """\
+if (%(orig_name)s != %(tmp_name)s) {
+    UPDATE_STRING_DICT_INPLACE(moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s, %(tmp_name)s);
+}"""
+
 # For module variable values, need to lookup in module dictionary or in
 # built-in dictionary.
 
@@ -156,6 +166,15 @@ template_read_mvar_unclear = """\
 %(tmp_name)s = LOOKUP_MODULE_VALUE(moduledict_%(module_identifier)s, %(var_name)s);
 """
 
+# Module variable read with fallback to built-ins via the helper code.
+template_read_mvar_with_fallback = """\
+%(value_name)s = GET_STRING_DICT_VALUE(moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s);
+
+if (unlikely(%(value_name)s == NULL)) {
+    %(value_name)s = %(helper_code)s(tstate, %(var_name)s);
+}
+"""
+
 template_read_locals_dict_with_fallback = """\
 %(to_name)s = %(dict_get_item)s(tstate, %(locals_dict)s, %(var_name)s);
 
@@ -200,16 +219,12 @@ template_read_locals_mapping_without_fallback = """\
 %(to_name)s = PyObject_GetItem(%(locals_dict)s, %(var_name)s);
 """
 
-# TODO: Have DICT_REMOVE_ITEM_WITHOUT_ERROR and use that instead.
 template_del_global_unclear = """\
-%(result)s = DICT_REMOVE_ITEM((PyObject *)moduledict_%(module_identifier)s, %(var_name)s);
-if (%(result)s == false) CLEAR_ERROR_OCCURRED(tstate);
+%(result)s = DICT_REMOVE_ITEM_WITHOUT_ERROR(tstate, (PyObject *)moduledict_%(module_identifier)s, %(var_name)s);
 """
 
 template_del_global_known = """\
-if (DICT_REMOVE_ITEM((PyObject *)moduledict_%(module_identifier)s, %(var_name)s) == false) {
-    CLEAR_ERROR_OCCURRED(tstate);
-}
+DICT_REMOVE_ITEM_WITHOUT_ERROR(tstate, (PyObject *)moduledict_%(module_identifier)s, %(var_name)s);
 """
 
 template_update_locals_dict_value = """\
@@ -219,9 +234,7 @@ if (%(test_code)s) {
 
     UPDATE_STRING_DICT0((PyDictObject *)%(dict_name)s, (Nuitka_StringObject *)%(var_name)s, value);
 } else {
-    if (DICT_REMOVE_ITEM(%(dict_name)s, %(var_name)s) == false) {
-        CLEAR_ERROR_OCCURRED(tstate);
-    }
+    DICT_REMOVE_ITEM_WITHOUT_ERROR(tstate, %(dict_name)s, %(var_name)s);
 }
 """
 
@@ -290,6 +303,87 @@ if (%(test_code)s) {
 }
 """
 
+# Variable templates are used for every access, these are compiled to functions
+# that just join the parts and emit them, avoiding the '%' parsing for every use.
+from .TemplateCompiler import compileTemplateEmitter  # isort:skip
+
+emit_write_local_unclear_ref0 = compileTemplateEmitter(
+    template_write_local_unclear_ref0, "emit_write_local_unclear_ref0"
+)
+emit_write_local_unclear_ref1 = compileTemplateEmitter(
+    template_write_local_unclear_ref1, "emit_write_local_unclear_ref1"
+)
+emit_write_local_empty_ref0 = compileTemplateEmitter(
+    template_write_local_empty_ref0, "emit_write_local_empty_ref0"
+)
+emit_write_local_empty_ref1 = compileTemplateEmitter(
+    template_write_local_empty_ref1, "emit_write_local_empty_ref1"
+)
+emit_write_local_clear_ref0 = compileTemplateEmitter(
+    template_write_local_clear_ref0, "emit_write_local_clear_ref0"
+)
+emit_write_local_clear_ref1 = compileTemplateEmitter(
+    template_write_local_clear_ref1, "emit_write_local_clear_ref1"
+)
+emit_write_local_inplace = compileTemplateEmitter(
+    template_write_local_inplace, "emit_write_local_inplace"
+)
+emit_write_shared_inplace = compileTemplateEmitter(
+    template_write_shared_inplace, "emit_write_shared_inplace"
+)
+emit_write_shared_unclear_ref0 = compileTemplateEmitter(
+    template_write_shared_unclear_ref0, "emit_write_shared_unclear_ref0"
+)
+emit_write_shared_unclear_ref1 = compileTemplateEmitter(
+    template_write_shared_unclear_ref1, "emit_write_shared_unclear_ref1"
+)
+emit_write_shared_clear_ref0 = compileTemplateEmitter(
+    template_write_shared_clear_ref0, "emit_write_shared_clear_ref0"
+)
+emit_write_shared_clear_ref1 = compileTemplateEmitter(
+    template_write_shared_clear_ref1, "emit_write_shared_clear_ref1"
+)
+emit_del_local_tolerant = compileTemplateEmitter(
+    template_del_local_tolerant, "emit_del_local_tolerant"
+)
+emit_del_shared_tolerant = compileTemplateEmitter(
+    template_del_shared_tolerant, "emit_del_shared_tolerant"
+)
+emit_del_local_intolerant = compileTemplateEmitter(
+    template_del_local_intolerant, "emit_del_local_intolerant"
+)
+emit_del_shared_intolerant = compileTemplateEmitter(
+    template_del_shared_intolerant, "emit_del_shared_intolerant"
+)
+emit_del_local_known = compileTemplateEmitter(
+    template_del_local_known, "emit_del_local_known"
+)
+emit_del_shared_known = compileTemplateEmitter(
+    template_del_shared_known, "emit_del_shared_known"
+)
+emit_release_object_unclear = compileTemplateEmitter(
+    template_release_object_unclear, "emit_release_object_unclear"
+)
+emit_release_object_clear = compileTemplateEmitter(
+    template_release_object_clear, "emit_release_object_clear"
+)
+emit_write_mvar = compileTemplateEmitter(template_write_mvar, "emit_write_mvar")
+emit_write_mvar_inplace = compileTemplateEmitter(
+    template_write_mvar_inplace, "emit_write_mvar_inplace"
+)
+emit_read_mvar_unclear = compileTemplateEmitter(
+    template_read_mvar_unclear, "emit_read_mvar_unclear"
+)
+emit_read_mvar_with_fallback = compileTemplateEmitter(
+    template_read_mvar_with_fallback, "emit_read_mvar_with_fallback"
+)
+emit_del_global_unclear = compileTemplateEmitter(
+    template_del_global_unclear, "emit_del_global_unclear"
+)
+emit_del_global_known = compileTemplateEmitter(
+    template_del_global_known, "emit_del_global_known"
+)
+
 from . import TemplateDebugWrapper  # isort:skip
 
 TemplateDebugWrapper.checkDebug(globals())
@@ -0,0 +1,85 @@
+#     Copyright 2024, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+""" Compile '%(name)s' style templates into emitting functions.
+
+For templates used very often, e.g. for every variable access, parsing the
+format string and looking up the values in a dictionary each time is a lot
+of overhead. Instead, these are translated once into a function that just
+joins the literal parts with the values passed, and emits the result.
+
+"""
+
+import re
+
+_template_key_regex = re.compile(r"%\((\w+)\)s")
+
+
+def compileTemplateEmitter(template, name="emitTemplate"):
+    """Compile a template into a function that emits it.
+
+    Args:
+        template: the template string with only '%(name)s' and '%%' uses
+        name: name of the function, to find it in profiles and tracebacks
+
+    Returns:
+        Function that takes the "emit" to use and the template values as
+        arguments, and emits the same string as applying the template with
+        '%' would give.
+    """
+
+    parts = _template_key_regex.split(template)
+
+    literals = parts[0::2]
+    keys = parts[1::2]
+
+    arg_names = []
+    for key in keys:
+        if key not in arg_names:
+            arg_names.append(key)
+
+    assert "emit" not in arg_names, name
+
+    values = []
+    for count, literal in enumerate(literals):
+        assert "%" not in literal.replace("%%", ""), (name, literal)
+
+        literal = literal.replace("%%", "%")
+
+        if literal:
+            values.append(repr(literal))
+
+        if count < len(keys):
+            values.append(keys[count])
+
+    source_code = "def %s(%s):\n" % (name, ", ".join(["emit"] + arg_names))
+
+    # Values are commonly variable declarations, these need to be converted
+    # like "%s" would do.
+    for arg_name in arg_names:
+        source_code += "    %s = str(%s)\n" % (arg_name, arg_name)
+
+    source_code += '    emit("".join((%s,)))\n' % (", ".join(values) or '""')
+
+    # Using exec here, to create the function from generated source code,
+    # pylint: disable=exec-used
+    module_dict = {}
+    exec(compile(source_code, "<%s>" % name, "exec"), module_dict)
+
+    return module_dict[name]
+
+
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.